@@ -1,5 +1,8 @@
-from typing import Any, List, Dict, Union, Optional
+from typing import Any, Deque, List, Dict, Union, Optional
 from abc import ABC, abstractmethod
+from array import array
+from collections import deque
+import time
 
 
 class DataStream(ABC):
@@ -137,23 +140,34 @@ class TransactionStream(DataStream):
         }
 
 
+EVENT_CODES = {"login": 0, "logout": 1, "error": 2, "failure": 3}
+EVENT_ERROR = EVENT_CODES["error"]
+EVENT_FAILURE = EVENT_CODES["failure"]
+EVENT_UNKNOWN = len(EVENT_CODES)
+
+
 class EventStream(DataStream):
     def __init__(self, stream_id: str) -> None:
         super().__init__(stream_id)
         self.type = "System Events"
         self.events = 0
         self.failures = 0
+        self.counts = array("Q", [0] * (EVENT_UNKNOWN + 1))
 
     def process_batch(self, data_batch: List[Any]) -> str:
-        events = 0
+        events = len(data_batch)
+        known = 0
         errors = 0
-        for event in data_batch:
-            events += 1
-            self.events += 1
-            if event == "error":
-                errors += 1
-            elif event == "failure":
-                self.failures += 1
+        for event, code in EVENT_CODES.items():
+            count = data_batch.count(event)
+            self.counts[code] += count
+            known += count
+            if code == EVENT_ERROR:
+                errors = count
+            elif code == EVENT_FAILURE:
+                self.failures += count
+        self.counts[EVENT_UNKNOWN] += events - known
+        self.events += events
         if errors == 1:
             return f"{events} events, {errors} error detected"
         return f"{events} events, {errors} errors detected"
@@ -164,20 +178,106 @@ class EventStream(DataStream):
         for item in data_batch:
             if isinstance(item, str):
                 if criteria is None:
-                    if (item == "login" or item == "logout"
-                            or item == "error" or item == "failure"):
+                    if item in EVENT_CODES:
                         data.append(item)
                 elif "high-priority" in criteria:
                     if item == "failure":
                         data.append(item)
         return data
 
-    def get_stats(self) -> Dict[str, Union[str, int, float]]:
+    def get_stats(self) -> Dict[str, Union[str, int, float, List[int]]]:
         return {
             "stream_id": self.stream_id,
             "type": self.type,
             "events": self.events,
-            "failures": self.failures
+            "failures": self.failures,
+            "counts": self.counts.tolist()
+        }
+
+
+class EventBatcher:
+    def __init__(self, stream: EventStream, max_latency: float = 0.01,
+                 min_size: int = 64, max_size: int = 65536) -> None:
+        if not max_latency > 0:
+            raise ValueError("max_latency must be positive")
+        if min_size < 1 or min_size > max_size:
+            raise ValueError("batch sizes must satisfy "
+                             "1 <= min_size <= max_size")
+        self.stream = stream
+        self.max_latency = max_latency
+        self.min_size = min_size
+        self.max_size = max_size
+        self.batch_size = min_size
+        self.pending: List[Any] = []
+        self.deadline = 0.0
+        self.first_arrival = 0.0
+        self.latencies: Deque[float] = deque(maxlen=1024)
+        self.batches = 0
+
+    def add(self, event: Any) -> Optional[str]:
+        now = time.perf_counter()
+        if not self.pending:
+            self.first_arrival = now
+            self.deadline = now + self.max_latency / 2
+        self.pending.append(event)
+        if len(self.pending) >= self.batch_size or now >= self.deadline:
+            return self.flush()
+        return None
+
+    def extend(self, events: List[Any]) -> List[str]:
+        results: List[str] = []
+        index = 0
+        while index < len(events):
+            if not self.pending:
+                self.first_arrival = time.perf_counter()
+                self.deadline = self.first_arrival + self.max_latency / 2
+            room = self.batch_size - len(self.pending)
+            self.pending.extend(events[index:index + room])
+            index += room
+            if (len(self.pending) >= self.batch_size
+                    or time.perf_counter() >= self.deadline):
+                result = self.flush()
+                if result is not None:
+                    results.append(result)
+        return results
+
+    def poll(self) -> Optional[str]:
+        if self.pending and time.perf_counter() >= self.deadline:
+            return self.flush()
+        return None
+
+    def flush(self) -> Optional[str]:
+        if not self.pending:
+            return None
+        batch = self.pending
+        self.pending = []
+        start = time.perf_counter()
+        result = self.stream.process_batch(batch)
+        end = time.perf_counter()
+        self.latencies.append(end - self.first_arrival)
+        self.batches += 1
+        self.tune(end - start, len(batch))
+        return result
+
+    def tune(self, elapsed: float, size: int) -> None:
+        if elapsed <= 0:
+            target = self.max_size
+        else:
+            target = int(size * (self.max_latency / 2) / elapsed)
+        target = max(self.min_size, min(self.max_size, target))
+        self.batch_size = (self.batch_size + target) // 2
+
+    def get_stats(self) -> Dict[str, Union[str, int, float]]:
+        p99 = 0.0
+        if self.latencies:
+            ordered = sorted(self.latencies)
+            p99 = ordered[int(0.99 * (len(ordered) - 1))]
+        return {
+            "stream_id": self.stream.stream_id,
+            "batches": self.batches,
+            "batch_size": self.batch_size,
+            "pending": len(self.pending),
+            "p99_latency": p99
         }
 
 
@@ -188,9 +288,27 @@ class StreamProcessor():
             TransactionStream(t_stream),
             EventStream(e_stream)
         ]
+        self.profiler: Optional[Any] = None
+
+    def enable_profiling(self, profiler: Any) -> None:
+        self.profiler = profiler
+
+    def disable_profiling(self) -> Optional[Any]:
+        profiler = self.profiler
+        self.profiler = None
+        if profiler is not None:
+            profiler.dump()
+        return profiler
 
     def process_batch(self, data_batch: List[Any],
                       criteria: Optional[str] = None) -> str:
+        if self.profiler is not None:
+            return self.profiler.run(self.process_streams, data_batch,
+                                     criteria)
+        return self.process_streams(data_batch, criteria)
+
+    def process_streams(self, data_batch: List[Any],
+                        criteria: Optional[str] = None) -> str:
         index = 0
         processed = ""
         while index < len(self.streams):
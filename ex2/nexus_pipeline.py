@@ -1,4 +1,4 @@
-from typing import Any, List, Union, Protocol
+from typing import Any, Callable, Dict, List, Optional, Union, Protocol
 from abc import ABC, abstractmethod
 
 
@@ -121,6 +121,14 @@ class OutputStage:
                     f"{average:.1f}ºC")
 
 
+class Profiler(Protocol):
+    def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        return func(*args)
+
+    def dump(self) -> None:
+        pass
+
+
 class ProcessingPipeline(ABC):
     def __init__(self, pipeline_id: str):
         self.stages: List[ProcessingStage] = []
@@ -162,16 +170,31 @@ class StreamAdapter(ProcessingPipeline):
 class NexusManager():
     def __init__(self):
         self.pipelines = []
+        self.profilers: Dict[str, Profiler] = {}
 
     def add_pipeline(self, pipeline: ProcessingPipeline) -> None:
         if pipeline:
             self.pipelines.append(pipeline)
 
+    def enable_profiling(self, pipeline_id: str,
+                         profiler: Profiler) -> None:
+        self.profilers[pipeline_id] = profiler
+
+    def disable_profiling(self, pipeline_id: str) -> Optional[Profiler]:
+        profiler = self.profilers.pop(pipeline_id, None)
+        if profiler is not None:
+            profiler.dump()
+        return profiler
+
     def process_data(self, pipeline_id: str, data: Any) -> str:
         for pipeline in self.pipelines:
             if pipeline.pipeline_id == pipeline_id:
+                profiler = self.profilers.get(pipeline_id)
                 try:
-                    output = pipeline.process(data)
+                    if profiler is None:
+                        output = pipeline.process(data)
+                    else:
+                        output = profiler.run(pipeline.process, data)
                     if output is None:
                         raise ValueError()
                     return output
@@ -0,0 +1,165 @@
+import os
+import sys
+from typing import Any, Dict, List
+
+
+MODULES = {
+    "processor": ("ex0", "stream_processor"),
+    "stream": ("ex1", "data_stream"),
+    "pipeline": ("ex2", "nexus_pipeline"),
+}
+
+USAGE = """usage: python3 nexus.py <command> <kind> [data ...]
+
+commands:
+  processor numeric|text|log DATA...
+  stream    sensor|transaction|event [--high-priority] DATA...
+  pipeline  json|csv|stream [--profile PATH [--allocations]] DATA...
+
+startup cost: python3 -X importtime nexus.py <command> ..."""
+
+
+def load_module(command: str) -> Any:
+    directory, name = MODULES[command]
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        directory)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+    return __import__(name)
+
+
+def parse_value(value: str) -> Any:
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def parse_pairs(args: List[str]) -> List[Dict[str, Any]]:
+    pairs = []
+    for arg in args:
+        if "=" not in arg:
+            raise ValueError(f"expected key=value, got '{arg}'")
+        key, value = arg.split("=", 1)
+        pairs.append({key: parse_value(value)})
+    return pairs
+
+
+def require_data(args: List[str]) -> None:
+    if not args:
+        raise ValueError("no data given")
+
+
+def run_processor(kind: str, args: List[str]) -> int:
+    require_data(args)
+    module = load_module("processor")
+    if kind == "numeric":
+        processor = module.NumericProcessor()
+        data: Any = [parse_value(arg) for arg in args]
+        if len(data) == 1:
+            data = data[0]
+    elif kind == "text":
+        processor = module.TextProcessor()
+        data = " ".join(args)
+    elif kind == "log":
+        processor = module.LogProcessor()
+        data = " ".join(args)
+    else:
+        raise ValueError(f"unknown processor '{kind}'")
+    if not processor.validate(data):
+        print("Validation: Invalid input")
+        return 1
+    print(processor.format_output(processor.process(data)))
+    return 0
+
+
+def run_stream(kind: str, args: List[str]) -> int:
+    criteria = None
+    if "--high-priority" in args:
+        criteria = "high-priority"
+        args = [arg for arg in args if arg != "--high-priority"]
+    require_data(args)
+    module = load_module("stream")
+    if kind == "sensor":
+        stream = module.SensorStream("SENSOR_CLI")
+        data: List[Any] = parse_pairs(args)
+    elif kind == "transaction":
+        stream = module.TransactionStream("TRANS_CLI")
+        data = parse_pairs(args)
+    elif kind == "event":
+        stream = module.EventStream("EVENT_CLI")
+        data = args
+    else:
+        raise ValueError(f"unknown stream '{kind}'")
+    data = stream.filter_data(data, criteria)
+    print(stream.process_batch(data))
+    return 0
+
+
+def run_pipeline(kind: str, args: List[str]) -> int:
+    profile = None
+    allocations = "--allocations" in args
+    if allocations:
+        args = [arg for arg in args if arg != "--allocations"]
+    if "--profile" in args:
+        index = args.index("--profile")
+        if index + 1 >= len(args):
+            raise ValueError("--profile expects an output path")
+        profile = args[index + 1]
+        args = args[:index] + args[index + 2:]
+    require_data(args)
+    module = load_module("pipeline")
+    if kind == "json":
+        adapter = module.JSONAdapter("json_cli")
+        data: Any = {}
+        for pair in parse_pairs(args):
+            data.update(pair)
+    elif kind == "csv":
+        adapter = module.CSVAdapter("csv_cli")
+        data = ",".join(args)
+    elif kind == "stream":
+        adapter = module.StreamAdapter("stream_cli")
+        data = [parse_value(arg) for arg in args]
+    else:
+        raise ValueError(f"unknown pipeline '{kind}'")
+    adapter.add_stage(module.InputStage())
+    adapter.add_stage(module.TransformStage())
+    adapter.add_stage(module.OutputStage())
+    nexus = module.NexusManager()
+    nexus.add_pipeline(adapter)
+    if profile is not None:
+        from nexus_profiler import CallProfiler
+        nexus.enable_profiling(adapter.pipeline_id,
+                               CallProfiler(profile, allocations))
+    output = nexus.process_data(adapter.pipeline_id, data)
+    nexus.disable_profiling(adapter.pipeline_id)
+    if output is None:
+        return 1
+    print(output)
+    return 0
+
+
+COMMANDS = {
+    "processor": run_processor,
+    "stream": run_stream,
+    "pipeline": run_pipeline,
+}
+
+
+def main(argv: List[str]) -> int:
+    if len(argv) < 2 or argv[0] not in COMMANDS:
+        print(USAGE)
+        return 2
+    try:
+        return COMMANDS[argv[0]](argv[1], argv[2:])
+    except ValueError as error:
+        print(f"nexus: {error}")
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
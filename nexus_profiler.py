@@ -0,0 +1,93 @@
+from typing import Any, Callable, Dict, List
+import sys
+import os
+import time
+
+
+class CallProfiler:
+    def __init__(self, output_path: str, allocations: bool = False) -> None:
+        self.output_path = output_path
+        self.allocations = allocations
+        self.stacks: Dict[str, int] = {}
+        self.frames: List[str] = []
+        self.last = 0
+        self.alloc_sizes: Dict[str, int] = {}
+        self.alloc_counts: Dict[str, int] = {}
+        self.runs = 0
+
+    def frame_name(self, frame: Any) -> str:
+        code = frame.f_code
+        name = code.co_name
+        if code.co_argcount > 0 and code.co_varnames[0] == "self":
+            owner = frame.f_locals.get("self")
+            if owner is not None:
+                name = f"{type(owner).__name__}.{name}"
+        return (f"{name}:{os.path.basename(code.co_filename)}"
+                f":{code.co_firstlineno}")
+
+    def trace(self, frame: Any, event: str, arg: Any) -> None:
+        if event != "call" and event != "return":
+            return
+        now = time.perf_counter_ns()
+        if self.frames:
+            stack = ";".join(self.frames)
+            self.stacks[stack] = self.stacks.get(stack, 0) + now - self.last
+        if event == "call":
+            self.frames.append(self.frame_name(frame))
+        elif self.frames:
+            self.frames.pop()
+        self.last = time.perf_counter_ns()
+
+    def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        previous = sys.getprofile()
+        if previous is not None and not callable(previous):
+            return func(*args)
+        tracemalloc = None
+        started = False
+        before = None
+        if self.allocations:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started = True
+            before = tracemalloc.take_snapshot()
+        self.frames = []
+        self.last = time.perf_counter_ns()
+        sys.setprofile(self.trace)
+        try:
+            return func(*args)
+        finally:
+            sys.setprofile(previous)
+            self.runs += 1
+            if tracemalloc is not None:
+                after = tracemalloc.take_snapshot()
+                if started:
+                    tracemalloc.stop()
+                filters = [
+                    tracemalloc.Filter(False, tracemalloc.__file__),
+                    tracemalloc.Filter(False, __file__)
+                ]
+                stats = after.filter_traces(filters).compare_to(
+                    before.filter_traces(filters), "lineno")
+                for stat in stats:
+                    site = str(stat.traceback)
+                    self.alloc_sizes[site] = (self.alloc_sizes.get(site, 0)
+                                              + stat.size_diff)
+                    self.alloc_counts[site] = (self.alloc_counts.get(site, 0)
+                                               + stat.count_diff)
+
+    def dump(self) -> None:
+        try:
+            with open(f"{self.output_path}.collapsed", "w") as output:
+                for stack, weight in self.stacks.items():
+                    output.write(f"{stack} {weight}\n")
+            if self.allocations:
+                sites = sorted(self.alloc_sizes.items(),
+                               key=lambda item: abs(item[1]), reverse=True)
+                with open(f"{self.output_path}.alloc.txt", "w") as output:
+                    output.write(f"runs: {self.runs}\n")
+                    for site, size in sites[:10]:
+                        output.write(f"{site}: size={size:+} B, "
+                                     f"count={self.alloc_counts[site]:+}\n")
+        except OSError as error:
+            print(f"Profiling output failed: {error}", file=sys.stderr)
@@ -0,0 +1,8 @@
+import os
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT, os.path.join(ROOT, "ex1"), os.path.join(ROOT, "ex2")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,88 @@
+import time
+from typing import Any, Dict
+
+import pytest
+
+from data_stream import EventBatcher, EventStream
+
+
+def test_process_batch_counts_unknown_items() -> None:
+    stream = EventStream("EVENT_001")
+    result = stream.process_batch(["login", "error", 5, None, "error"])
+    assert result == "5 events, 2 errors detected"
+    stats = stream.get_stats()
+    assert stats["events"] == 5
+    assert stats["failures"] == 0
+    assert stats["counts"] == [1, 0, 2, 0, 2]
+
+
+def test_process_batch_accumulates_counts() -> None:
+    stream = EventStream("EVENT_001")
+    stream.process_batch(["failure", "logout"])
+    stream.process_batch(["failure", "login", "unknown"])
+    assert stream.get_stats()["counts"] == [1, 1, 0, 2, 1]
+    assert stream.get_stats()["failures"] == 2
+
+
+def test_add_flushes_on_size() -> None:
+    batcher = EventBatcher(EventStream("EVENT_001"), max_latency=60.0,
+                           min_size=2, max_size=2)
+    assert batcher.add("login") is None
+    assert batcher.add("error") == "2 events, 1 error detected"
+    assert batcher.get_stats()["pending"] == 0
+
+
+def test_poll_flushes_on_deadline() -> None:
+    batcher = EventBatcher(EventStream("EVENT_001"), max_latency=0.002,
+                           min_size=100, max_size=100)
+    assert batcher.add("login") is None
+    assert batcher.get_stats()["pending"] == 1
+    time.sleep(0.01)
+    assert batcher.poll() == "1 events, 0 errors detected"
+    assert batcher.get_stats()["batches"] == 1
+    assert batcher.get_stats()["pending"] == 0
+
+
+def test_extend_with_single_event_batches() -> None:
+    stream = EventStream("EVENT_001")
+    batcher = EventBatcher(stream, min_size=1, max_size=1)
+    results = batcher.extend(["login", "error", "logout"])
+    assert results == [
+        "1 events, 0 errors detected",
+        "1 events, 1 error detected",
+        "1 events, 0 errors detected"
+    ]
+    assert batcher.get_stats()["batches"] == 3
+    assert stream.get_stats()["events"] == 3
+
+
+def test_tune_stays_within_bounds() -> None:
+    batcher = EventBatcher(EventStream("EVENT_001"), max_latency=1.0,
+                           min_size=4, max_size=16)
+    for _ in range(10):
+        batcher.tune(0.0, 4)
+    assert batcher.batch_size <= 16
+    assert batcher.batch_size >= 15
+    for _ in range(10):
+        batcher.tune(100.0, 4)
+    assert batcher.batch_size >= 4
+    assert batcher.batch_size <= 5
+
+
+def test_stats_report_p99_latency() -> None:
+    batcher = EventBatcher(EventStream("EVENT_001"))
+    assert batcher.get_stats()["p99_latency"] == 0.0
+    batcher.latencies.extend(i / 1000 for i in range(100))
+    assert batcher.get_stats()["p99_latency"] == 0.098
+
+
+@pytest.mark.parametrize("settings", [
+    {"max_latency": 0},
+    {"max_latency": -1.0},
+    {"max_latency": float("nan")},
+    {"min_size": 0},
+    {"min_size": 10, "max_size": 5},
+])
+def test_invalid_settings_are_rejected(settings: Dict[str, Any]) -> None:
+    with pytest.raises(ValueError):
+        EventBatcher(EventStream("EVENT_001"), **settings)
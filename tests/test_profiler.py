@@ -0,0 +1,83 @@
+import sys
+from typing import Any
+
+import data_stream
+import nexus_pipeline
+from nexus_profiler import CallProfiler
+
+
+JSON_INPUT = {"sensor": "temp", "value": 23.5, "unit": "C"}
+JSON_OUTPUT = "Processed temperature reading: 23.5ºC (Normal range)"
+
+
+def make_nexus() -> Any:
+    nexus = nexus_pipeline.NexusManager()
+    for adapter in (nexus_pipeline.JSONAdapter("json_01"),
+                    nexus_pipeline.CSVAdapter("csv_01")):
+        adapter.add_stage(nexus_pipeline.InputStage())
+        adapter.add_stage(nexus_pipeline.TransformStage())
+        adapter.add_stage(nexus_pipeline.OutputStage())
+        nexus.add_pipeline(adapter)
+    return nexus
+
+
+def test_profiled_pipeline_writes_collapsed_stacks(tmp_path: Any) -> None:
+    nexus = make_nexus()
+    nexus.enable_profiling("json_01", CallProfiler(str(tmp_path / "json")))
+    assert nexus.process_data("json_01", JSON_INPUT) == JSON_OUTPUT
+    assert nexus.process_data("json_01", JSON_INPUT) == JSON_OUTPUT
+    assert nexus.disable_profiling("json_01").runs == 2
+    lines = (tmp_path / "json.collapsed").read_text().splitlines()
+    assert lines
+    nested = 0
+    for line in lines:
+        stack, weight = line.rsplit(" ", 1)
+        assert int(weight) >= 0
+        if ";" in stack:
+            nested += 1
+            assert stack.startswith("JSONAdapter.process:")
+    assert nested == 3
+    assert not (tmp_path / "json.alloc.txt").exists()
+
+
+def test_allocation_summary_is_opt_in(tmp_path: Any) -> None:
+    nexus = make_nexus()
+    nexus.enable_profiling("json_01",
+                           CallProfiler(str(tmp_path / "json"), True))
+    assert nexus.process_data("json_01", JSON_INPUT) == JSON_OUTPUT
+    nexus.disable_profiling("json_01")
+    summary = (tmp_path / "json.alloc.txt").read_text().splitlines()
+    assert summary[0] == "runs: 1"
+    assert all("profiler" not in line for line in summary)
+
+
+def test_unprofiled_pipeline_writes_nothing(tmp_path: Any) -> None:
+    nexus = make_nexus()
+    profiler = CallProfiler(str(tmp_path / "json"))
+    nexus.enable_profiling("json_01", profiler)
+    output = nexus.process_data("csv_01", "user,action,timestamp")
+    assert output == "User activity logged: 1 actions processed"
+    assert profiler.runs == 0
+    assert nexus.disable_profiling("csv_01") is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_unwritable_path_keeps_output(tmp_path: Any, capsys: Any) -> None:
+    nexus = make_nexus()
+    path = tmp_path / "missing" / "json"
+    nexus.enable_profiling("json_01", CallProfiler(str(path), True))
+    assert nexus.process_data("json_01", JSON_INPUT) == JSON_OUTPUT
+    nexus.disable_profiling("json_01")
+    assert "Profiling output failed" in capsys.readouterr().err
+
+
+def test_previous_profiler_is_restored(tmp_path: Any) -> None:
+    processor = data_stream.StreamProcessor("S", "T", "E")
+    processor.enable_profiling(CallProfiler(str(tmp_path / "inner")))
+    outer = CallProfiler(str(tmp_path / "outer"))
+    outer.run(processor.process_batch, ["login", "error"])
+    assert sys.getprofile() is None
+    processor.disable_profiling()
+    inner = (tmp_path / "inner.collapsed").read_text()
+    assert "EventStream.filter_data" in inner
+    assert outer.stacks
@@ -0,0 +1,38 @@
+import os
+import subprocess
+import sys
+from typing import Dict, List
+
+import pytest
+
+
+NEXUS = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), "nexus.py")
+STARTUP_BUDGET_US = 60_000
+LAZY_MODULES = ("asyncio", "numpy", "tracemalloc")
+
+
+def import_times(args: List[str]) -> Dict[str, int]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", NEXUS] + args,
+        capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(self_us)
+    return times
+
+
+@pytest.mark.parametrize("args", [
+    ["processor", "numeric", "1", "2", "3"],
+    ["stream", "event", "login", "error"],
+    ["pipeline", "csv", "user", "action", "timestamp"],
+])
+def test_startup_budget(args: List[str]) -> None:
+    times = import_times(args)
+    assert sum(times.values()) < STARTUP_BUDGET_US
+    for name in LAZY_MODULES:
+        assert name not in times